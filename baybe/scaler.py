@@ -104,27 +104,33 @@ class DefaultScaler(Scaler):
 
         import torch
 
-        # Get the searchspace boundaries
-        searchspace = to_tensor(self.searchspace)
-        bounds = torch.vstack(
-            [torch.min(searchspace, dim=0)[0], torch.max(searchspace, dim=0)[0]]
+        # Get the searchspace boundaries (computed on the dataframe itself, so that only
+        # the bounds and not the entire search space need to be converted to a tensor)
+        bounds = to_tensor(
+            pd.DataFrame([self.searchspace.min(), self.searchspace.max()])
         )
 
-        # Compute the mean and standard deviation of the training targets
+        # Compute the offset and range of the inputs once, so that they are not
+        # recomputed each time the scaling functions are called
+        lower = bounds[0]
+        span = bounds[1] - bounds[0]
+
+        # Compute the mean, standard deviation and variance of the training targets
         mean = torch.mean(y, dim=0)
         std = torch.std(y, dim=0)
+        var = std**2
 
         # Functions for input and target scaling
-        self.scale_x = lambda x: (x - bounds[0]) / (bounds[1] - bounds[0])
+        self.scale_x = lambda x: (x - lower) / span
         self.scale_y = lambda x: (x - mean) / std
 
         # Functions for inverse input and target scaling
-        self.unscale_x = lambda x: x * (bounds[1] - bounds[0]) + bounds[0]
+        self.unscale_x = lambda x: x * span + lower
         self.unscale_y = lambda x: x * std + mean
 
         # Functions for inverse mean and variance scaling
-        self.unscale_m = lambda x: x * std + mean
-        self.unscale_s = lambda x: x * std**2
+        self.unscale_m = self.unscale_y
+        self.unscale_s = lambda x: x * var
 
         # Flag that the scaler has been fitted
         self.fitted = True
@@ -540,13 +540,13 @@ class SubspaceDiscrete(SerialMixin):
         """
         if not self.parameters:
             return np.empty((2, 0))
+        comp_rep_columns = frozenset(self.comp_rep.columns)
+        comp_dfs = (
+            p.comp_df[[col for col in p.comp_df if col in comp_rep_columns]]
+            for p in self.parameters
+        )
         bounds = np.hstack(
-            [
-                np.vstack([p.comp_df[col].min(), p.comp_df[col].max()])
-                for p in self.parameters
-                for col in p.comp_df
-                if col in self.comp_rep.columns
-            ]
+            [np.vstack([df.min().to_numpy(), df.max().to_numpy()]) for df in comp_dfs]
         )
         return bounds
 
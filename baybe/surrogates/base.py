@@ -83,13 +83,13 @@ class Surrogate(ABC, SerialMixin):
         # Evaluate the posterior distribution
         mean, covar = self._posterior(candidates)
 
-        # Apply covariance transformation for marginal posterior models
-        if not self.joint_posterior:
-            # Convert to tensor containing covariance matrices
-            covar = torch.diag_embed(covar)
-
-        # Add small diagonal variances for numerical stability
-        covar.add_(torch.eye(covar.shape[-1]) * _MIN_VARIANCE)
+        # Add small diagonal variances for numerical stability. For marginal posterior
+        # models, this happens before converting the variances to covariance matrices,
+        # so that no additional dense identity matrix needs to be created.
+        if self.joint_posterior:
+            covar.diagonal(dim1=-2, dim2=-1).add_(_MIN_VARIANCE)
+        else:
+            covar = torch.diag_embed(covar + _MIN_VARIANCE)
 
         return mean, covar
 
@@ -40,8 +40,8 @@ class MeanPredictionSurrogate(Surrogate):
         import torch
 
         # TODO: use target value bounds for covariance scaling when explicitly provided
-        mean = self._model * torch.ones([len(candidates)])
-        var = torch.ones(len(candidates))
+        mean = self._model * torch.ones([len(candidates)], device=candidates.device)
+        var = torch.ones(len(candidates), device=candidates.device)
         return mean, var
 
     def _fit(self, searchspace: SearchSpace, train_x: Tensor, train_y: Tensor) -> None:
@@ -169,9 +169,9 @@ def autoscale(cls: type[Surrogate]):
     _posterior_original = cls._posterior
 
     def _posterior_new(self, candidates: Tensor) -> tuple[Tensor, Tensor]:
-        scaled = getattr(self, injected_scaler_attr_name).transform(candidates)
-        mean, covar = _posterior_original(self, scaled)
-        return getattr(self, injected_scaler_attr_name).untransform(mean, covar)
+        scaler = getattr(self, injected_scaler_attr_name)
+        mean, covar = _posterior_original(self, scaler.transform(candidates))
+        return scaler.untransform(mean, covar)
 
     def _fit_new(
         self, searchspace: SearchSpace, train_x: Tensor, train_y: Tensor
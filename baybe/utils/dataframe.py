@@ -50,14 +50,19 @@ def to_tensor(*dfs: pd.DataFrame) -> Tensor | Iterator[Tensor]:
     #  weirdly happen, even if all values are numeric, e.g. when a target column is
     #  looked up from a df in simulation, it can have dtype object even if it's all
     #  floats. As a simple fix (this seems to be the most reasonable place to take
-    #  care of this) df.values has been changed to df.values.astype(float),
-    #  even though this seems like double casting here.
+    #  care of this) the dataframes are explicitly cast to float via
+    #  df.to_numpy(dtype=DTypeFloatNumpy, copy=True).
     import torch
 
     from baybe.utils.torch import DTypeFloatTorch
 
+    # Requesting the dtype in the numpy conversion casts each block directly instead
+    # of first consolidating all blocks into an intermediate (potentially object-typed)
+    # array
     out = (
-        torch.from_numpy(df.values.astype(DTypeFloatNumpy)).to(DTypeFloatTorch)
+        torch.from_numpy(df.to_numpy(dtype=DTypeFloatNumpy, copy=True)).to(
+            DTypeFloatTorch
+        )
         for df in dfs
     )
     if len(dfs) == 1:
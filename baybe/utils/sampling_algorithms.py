@@ -4,7 +4,37 @@ from typing import Literal
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import pairwise_distances
+from sklearn.metrics import pairwise_distances, pairwise_distances_chunked
+
+_FPS_MAX_POINTS_DISTANCE_MATRIX = 4000
+"""The maximum number of points for which farthest point sampling precomputes the
+full pairwise distance matrix. For larger point sets, distances are computed on the fly
+to keep the memory footprint linear in the number of points."""
+
+
+def _farthest_pair(points: np.ndarray) -> tuple[int, int]:
+    """Find the pair of points with the largest Euclidean distance.
+
+    The pairwise distances are processed in chunks so that the full distance matrix is
+    never held in memory. Ties are resolved in the same way as for an ``argmax`` over
+    the full distance matrix.
+
+    Args:
+        points: The points to be considered, represented as a 2D array whose first
+            dimension corresponds to the point index.
+
+    Returns:
+        The positional indices of the two points.
+    """
+
+    def reduce_chunk(chunk: np.ndarray, _: int) -> tuple[np.ndarray, np.ndarray]:
+        cols = np.argmax(chunk, axis=1)
+        return chunk[np.arange(len(chunk)), cols], cols
+
+    chunks = pairwise_distances_chunked(points, reduce_func=reduce_chunk)
+    row_maxima, row_argmaxima = map(np.concatenate, zip(*chunks))
+    row = int(np.argmax(row_maxima))
+    return row, int(row_argmaxima[row])
 
 
 def farthest_point_sampling(
@@ -32,19 +62,31 @@ def farthest_point_sampling(
         A list containing the positional indices of the selected points.
 
     Raises:
+        ValueError: If more points are requested than are available for selection.
         ValueError: If an unknown initialization recommender is used.
     """
-    # Compute the pairwise distances between all points
-    dist_matrix = pairwise_distances(points)
+    if n_samples > len(points):
+        raise ValueError(
+            f"Farthest point sampling cannot select more points than are available, "
+            f"but {n_samples=} was given for {len(points)} points."
+        )
+
+    # Compute the pairwise distances between all points, unless there are too many
+    use_dist_matrix = len(points) <= _FPS_MAX_POINTS_DISTANCE_MATRIX
+    if use_dist_matrix:
+        dist_matrix = pairwise_distances(points)
 
     # Initialize the point selection subset
     if initialization == "random":
         selected_point_indices = [np.random.randint(0, len(points))]
     elif initialization == "farthest":
-        idx_1d = np.argmax(dist_matrix)
-        selected_point_indices = list(
-            map(int, np.unravel_index(idx_1d, dist_matrix.shape))
-        )
+        if use_dist_matrix:
+            idx_1d = np.argmax(dist_matrix)
+            selected_point_indices = list(
+                map(int, np.unravel_index(idx_1d, dist_matrix.shape))
+            )
+        else:
+            selected_point_indices = list(_farthest_pair(points))
         if n_samples == 1:
             return np.random.choice(selected_point_indices, 1).tolist()
         elif n_samples < 1:
@@ -52,28 +94,37 @@ def farthest_point_sampling(
                 f"Farthest point sampling must be done with >= 1 samples, but "
                 f"{n_samples=} was given."
             )
+
+        # If all points coincide, the farthest pair degenerates to a single point
+        if selected_point_indices[0] == selected_point_indices[1]:
+            selected_point_indices = [0, 1]
     else:
         raise ValueError(f"unknown initialization recommender: '{initialization}'")
 
-    # Initialize the list of remaining points
-    remaining_point_indices = list(range(len(points)))
-    for idx in selected_point_indices:
-        remaining_point_indices.remove(idx)
+    # Track for each point its smallest distance to the selected points. Already
+    # selected points are masked out so that they can never be selected again.
+    if use_dist_matrix:
+        dists = dist_matrix[:, selected_point_indices]
+    else:
+        dists = pairwise_distances(points, points[selected_point_indices])
+    min_dists = np.min(dists, axis=1)
+    min_dists[selected_point_indices] = -np.inf
 
     # Successively add the points with the largest distance
     while len(selected_point_indices) < n_samples:
-        # Collect distances between selected and remaining points
-        dist = dist_matrix[np.ix_(remaining_point_indices, selected_point_indices)]
-
-        # Find for each candidate point the smallest distance to the selected points
-        min_dists = np.min(dist, axis=1)
-
         # Choose the point with the "largest smallest distance"
-        selected_point_index = remaining_point_indices[np.argmax(min_dists)]
+        selected_point_index = int(np.argmax(min_dists))
 
         # Add the chosen point to the selection
         selected_point_indices.append(selected_point_index)
-        remaining_point_indices.remove(selected_point_index)
+
+        # Update the smallest distances using only the newly selected point
+        if use_dist_matrix:
+            dists = dist_matrix[:, selected_point_index]
+        else:
+            dists = pairwise_distances(points, points[[selected_point_index]])[:, 0]
+        np.minimum(min_dists, dists, out=min_dists)
+        min_dists[selected_point_index] = -np.inf
 
     return selected_point_indices
 
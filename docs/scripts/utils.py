@@ -15,28 +15,26 @@ def adjust_pictures(
         dark_version: The name of the dark mode picture version.
     """
     with open(file_path) as file:
-        lines = file.readlines()
+        content = file.read()
 
-    line_index = None
-    for i, line in enumerate(lines):
-        if match in line:
-            line_index = i
-            break
+    # Locate the first line containing the match via a single search over the file
+    match_index = content.find(match)
+    if match_index < 0:
+        return
+    line_start = content.rfind("\n", 0, match_index) + 1
+    line_end = content.find("\n", match_index) + 1 or len(content)
 
-    if line_index is not None:
-        line = lines[line_index]
-        light_line = line
-        light_line = light_line.replace(  # For replacing the banner
-            '"reference external"', '"reference external only-light"'
-        )
-        light_line = light_line.replace(  # For replacing the example plot
-            'img alt="Substance Encoding Example" ',
-            'img alt="Substance Encoding Example" class="only-light align-center" ',
-        )
-        lines[line_index] = light_line
-        dark_line = light_line.replace("light", "dark")
-        dark_line = dark_line.replace(light_version, dark_version)
-        lines.insert(line_index + 1, dark_line)
+    line = content[line_start:line_end]
+    light_line = line
+    light_line = light_line.replace(  # For replacing the banner
+        '"reference external"', '"reference external only-light"'
+    )
+    light_line = light_line.replace(  # For replacing the example plot
+        'img alt="Substance Encoding Example" ',
+        'img alt="Substance Encoding Example" class="only-light align-center" ',
+    )
+    dark_line = light_line.replace("light", "dark")
+    dark_line = dark_line.replace(light_version, dark_version)
 
-        with open(file_path, "w") as file:
-            file.writelines(lines)
+    with open(file_path, "w") as file:
+        file.write(content[:line_start] + light_line + dark_line + content[line_end:])
@@ -7,12 +7,13 @@ This means that the shown function approximation should always appear visually t
 when the input and output scales are changed.
 """
 
+from functools import partial
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import torch
 from botorch.optim import optimize_acqf_discrete
-from funcy import rpartial
 
 import streamlit as st
 from baybe.acquisition import qExpectedImprovement
@@ -25,39 +26,76 @@ from baybe.utils.basic import get_subclasses
 # define constants
 N_PARAMETER_VALUES = 1000
 
+# collect all available surrogate models
+SURROGATE_MODEL_CLASSES = {
+    surr.__name__: surr
+    for surr in get_subclasses(Surrogate)
+    if not issubclass(surr, CustomONNXSurrogate)
+}
+
 
 def cubic(
-    x: np.ndarray, x_min: float, x_max: float, amplitude: float, bias: float
-) -> np.ndarray:
+    x: torch.Tensor, *, x_min: float, x_max: float, amplitude: float, bias: float
+) -> torch.Tensor:
     """Cubic test function."""
-    out = amplitude * np.power((x - x_min) / (x_max - x_min), 3) + bias
+    out = amplitude * torch.pow((x - x_min) / (x_max - x_min), 3) + bias
     return out
 
 
 def sin(
-    x: np.ndarray, x_min: float, x_max: float, amplitude: float, bias: float
-) -> np.ndarray:
+    x: torch.Tensor, *, x_min: float, x_max: float, amplitude: float, bias: float
+) -> torch.Tensor:
     """Sinusoid test function."""
-    out = amplitude * np.sin((x - x_min) / (x_max - x_min) * 2 * np.pi) + bias
+    out = amplitude * torch.sin((x - x_min) / (x_max - x_min) * 2 * np.pi) + bias
     return out
 
 
 def constant(
-    x: np.ndarray, x_min: float, x_max: float, amplitude: float, bias: float
-) -> np.ndarray:
+    x: torch.Tensor, *, x_min: float, x_max: float, amplitude: float, bias: float
+) -> torch.Tensor:
     """Constant test function."""
-    out = np.full(x.shape, fill_value=bias)
+    out = torch.full_like(x, fill_value=bias)
     return out
 
 
 def linear(
-    x: np.ndarray, x_min: float, x_max: float, amplitude: float, bias: float
-) -> np.ndarray:
+    x: torch.Tensor, *, x_min: float, x_max: float, amplitude: float, bias: float
+) -> torch.Tensor:
     """Linear test function."""
-    out = amplitude * np.linspace(0, 1, len(x)) + bias
+    out = amplitude * torch.linspace(0, 1, len(x)) + bias
     return out
 
 
+@st.cache_resource
+def create_searchspace(x_min: float, x_max: float) -> SearchSpace:
+    """Create the search space spanned by the parameter grid (cached across reruns)."""
+    values = torch.linspace(x_min, x_max, N_PARAMETER_VALUES).tolist()
+    param = NumericalDiscreteParameter(name="param", values=values)
+    return SearchSpace.from_product(parameters=[param])
+
+
+@st.cache_resource
+def fit_surrogate(
+    surrogate_name: str,
+    x_min: float,
+    x_max: float,
+    train_x: tuple[float, ...],
+    train_y: tuple[float, ...],
+    random_seed: int,
+) -> Surrogate:
+    """Create and train a surrogate model (cached across reruns)."""
+    np.random.seed(random_seed)
+    torch.manual_seed(random_seed)
+
+    surrogate_model = SURROGATE_MODEL_CLASSES[surrogate_name]()
+    surrogate_model.fit(
+        create_searchspace(x_min, x_max),
+        torch.tensor(train_x).unsqueeze(-1),
+        torch.tensor(train_y).unsqueeze(-1),
+    )
+    return surrogate_model
+
+
 def main():
     """Create the streamlit dashboard."""
     # basic settings
@@ -74,18 +112,11 @@ def main():
         "Cubic": cubic,
     }
 
-    # collect all available surrogate models
-    surrogate_model_classes = {
-        surr.__name__: surr
-        for surr in get_subclasses(Surrogate)
-        if not issubclass(surr, CustomONNXSurrogate)
-    }
-
     # simulation parameters
     random_seed = int(st.sidebar.number_input("Random seed", value=1337))
     function_name = st.sidebar.selectbox("Test function", list(test_functions.keys()))
     surrogate_name = st.sidebar.selectbox(
-        "Surrogate model", list(surrogate_model_classes.keys())
+        "Surrogate model", list(SURROGATE_MODEL_CLASSES.keys())
     )
     n_training_points = st.sidebar.slider("Number of training points", 1, 20, 5)
     n_recommendations = st.sidebar.slider("Number of recommendations", 1, 20, 5)
@@ -102,59 +133,66 @@ def main():
     function_bias = st.sidebar.slider("Function bias", -100.0, 100.0, 0.0)
 
     # fix the chosen random seed
-    np.random.seed(random_seed)
     torch.manual_seed(random_seed)
 
     # select the test function and the surrogate model class
-    fun = rpartial(
+    fun = partial(
         test_functions[function_name],
-        lower_parameter_limit,
-        upper_parameter_limit,
-        function_amplitude,
-        function_bias,
+        x_min=lower_parameter_limit,
+        x_max=upper_parameter_limit,
+        amplitude=function_amplitude,
+        bias=function_bias,
     )
 
     # create the input grid and corresponding target values
     test_x = torch.linspace(
         lower_parameter_limit, upper_parameter_limit, N_PARAMETER_VALUES
     )
-    test_y = torch.from_numpy(fun(test_x.numpy()))
+    test_y = fun(test_x)
 
     # randomly select the specified number of training data points
-    train_idx = np.random.choice(
-        range(N_PARAMETER_VALUES), n_training_points, replace=False
-    )
+    generator = torch.Generator().manual_seed(random_seed)
+    permutation = torch.randperm(N_PARAMETER_VALUES, generator=generator)
+    train_idx = permutation[:n_training_points]
     train_x = test_x[train_idx]
     train_y = test_y[train_idx]
 
     # create the searchspace object
-    param = NumericalDiscreteParameter(name="param", values=test_x.numpy().tolist())
-    searchspace = SearchSpace.from_product(parameters=[param])
+    searchspace = create_searchspace(lower_parameter_limit, upper_parameter_limit)
 
     # create the surrogate model, train it, and get its predictions
-    surrogate_model = surrogate_model_classes[surrogate_name]()
-    surrogate_model.fit(searchspace, train_x.unsqueeze(-1), train_y.unsqueeze(-1))
-
-    # recommend next experiments
-    # TODO: use BayBE recommender and add widgets for recommender selection
-    acqf = qExpectedImprovement().to_botorch(
-        surrogate_model, searchspace, pd.DataFrame(train_x), pd.DataFrame(train_y)
+    surrogate_model = fit_surrogate(
+        surrogate_name,
+        lower_parameter_limit,
+        upper_parameter_limit,
+        tuple(train_x.tolist()),
+        tuple(train_y.tolist()),
+        random_seed,
     )
-    recommendatations = optimize_acqf_discrete(
-        acqf, q=n_recommendations, choices=test_x.unsqueeze(-1)
-    )[0]
 
-    # create the mean and standard deviation predictions for the entire search space
-    mean, covar = surrogate_model.posterior(test_x.unsqueeze(-1))
-    mean = mean.detach().numpy()
-    std = covar.diag().sqrt().detach().numpy()
+    # disable autograd since no gradients are needed for the predictions
+    with torch.no_grad():
+        # recommend next experiments
+        # TODO: use BayBE recommender and add widgets for recommender selection
+        acqf = qExpectedImprovement().to_botorch(
+            surrogate_model, searchspace, pd.DataFrame(train_x), pd.DataFrame(train_y)
+        )
+        recommendatations = optimize_acqf_discrete(
+            acqf, q=n_recommendations, choices=test_x.unsqueeze(-1)
+        )[0]
+
+        # create the mean and standard deviation predictions for the entire space
+        mean, covar = surrogate_model.posterior(test_x.unsqueeze(-1))
+        std = covar.diag().sqrt()
+        lower_band, upper_band = torch.stack([mean - std, mean + std]).numpy()
+        mean = mean.numpy()
 
     # visualize the test function, training points, model predictions, recommendations
     fig = plt.figure()
     plt.plot(test_x, test_y, color="tab:blue", label="Test function")
     plt.plot(train_x, train_y, "o", color="tab:blue")
     plt.plot(test_x, mean, color="tab:red", label="Surrogate model")
-    plt.fill_between(test_x, mean - std, mean + std, alpha=0.2, color="tab:red")
+    plt.fill_between(test_x, lower_band, upper_band, alpha=0.2, color="tab:red")
     plt.vlines(
         recommendatations, *plt.gca().get_ylim(), color="k", label="Recommendations"
     )
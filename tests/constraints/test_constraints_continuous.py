@@ -91,26 +91,16 @@ def test_hybridspace_ineq(campaign, n_iterations, batch_size):
     assert (1.0 * res["Conti_finite1"] + 1.0 * res["Conti_finite2"]).ge(0.299).all()
 
 
-def test_invalid_constraints():
+@pytest.mark.parametrize(
+    "constraint_cls",
+    [ContinuousLinearEqualityConstraint, ContinuousLinearInequalityConstraint],
+    ids=["eq", "ineq"],
+)
+@pytest.mark.parametrize(
+    "coefficients", [[1.0], [1.0, 2.0, 3.0]], ids=["too_few", "too_many"]
+)
+def test_invalid_constraints(constraint_cls, coefficients):
     """Test invalid continuous constraint creations."""
     # number of parameters and coefficients doesn't match
-
-    with pytest.raises(ValueError):
-        ContinuousLinearEqualityConstraint(
-            parameters=["A", "B"], coefficients=[1.0], rhs=0.0
-        )
-
-    with pytest.raises(ValueError):
-        ContinuousLinearEqualityConstraint(
-            parameters=["A", "B"], coefficients=[1.0, 2.0, 3.0], rhs=0.0
-        )
-
-    with pytest.raises(ValueError):
-        ContinuousLinearInequalityConstraint(
-            parameters=["A", "B"], coefficients=[1.0], rhs=0.0
-        )
-
     with pytest.raises(ValueError):
-        ContinuousLinearInequalityConstraint(
-            parameters=["A", "B"], coefficients=[1.0, 2.0, 3.0], rhs=0.0
-        )
+        constraint_cls(parameters=["A", "B"], coefficients=coefficients, rhs=0.0)
@@ -4,12 +4,19 @@ import math
 import numpy as np
 import pandas as pd
 import pytest
+import sklearn
 from pytest import param
+from sklearn.metrics import pairwise_distances, pairwise_distances_chunked
 
 from baybe.utils.basic import register_hooks
 from baybe.utils.memory import bytes_to_human_readable
 from baybe.utils.numerical import closest_element
-from baybe.utils.sampling_algorithms import DiscreteSamplingMethod, sample_numerical_df
+from baybe.utils.sampling_algorithms import (
+    DiscreteSamplingMethod,
+    _farthest_pair,
+    farthest_point_sampling,
+    sample_numerical_df,
+)
 
 _TARGET = 1337
 _CLOSEST = _TARGET + 0.1
@@ -81,6 +88,58 @@ def test_discrete_sampling(fraction, method):
         ), "Undersized sampling did not return unique points."
 
 
+@pytest.mark.parametrize("initialization", ["farthest", "random"])
+def test_farthest_point_sampling_too_many_samples(initialization):
+    """Requesting more points than available raises an error."""
+    with pytest.raises(ValueError, match="more points than are available"):
+        farthest_point_sampling(np.random.rand(3, 2), 5, initialization)
+
+
+@pytest.mark.parametrize("initialization", ["farthest", "random"])
+def test_farthest_point_sampling_identical_points(initialization):
+    """Identical points are still selected without repetition."""
+    selected = farthest_point_sampling(np.zeros((3, 2)), 3, initialization)
+    assert sorted(selected) == [0, 1, 2]
+
+
+@pytest.mark.parametrize("initialization", ["farthest", "random"])
+def test_farthest_point_sampling_without_distance_matrix(monkeypatch, initialization):
+    """Computing distances on the fly yields the same selection as the full matrix."""
+    points = np.random.rand(50, 3)
+    seed = np.random.randint(0, 1000)
+
+    np.random.seed(seed)
+    expected = farthest_point_sampling(points, 10, initialization)
+
+    monkeypatch.setattr(
+        "baybe.utils.sampling_algorithms._FPS_MAX_POINTS_DISTANCE_MATRIX", 0
+    )
+    np.random.seed(seed)
+    actual = farthest_point_sampling(points, 10, initialization)
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        param(np.random.rand(200, 3), id="continuous"),
+        param(np.random.randint(0, 3, size=(200, 2)).astype(float), id="ties"),
+    ],
+)
+def test_farthest_pair_across_chunks(points):
+    """The chunked farthest pair search agrees with the full distance matrix."""
+    dist_matrix = pairwise_distances(points)
+    expected = np.unravel_index(np.argmax(dist_matrix), dist_matrix.shape)
+
+    # Limit the working memory so that the distances are split into several chunks
+    with sklearn.config_context(working_memory=0.01):
+        assert len(list(pairwise_distances_chunked(points))) > 1
+        actual = _farthest_pair(points)
+
+    assert actual == tuple(map(int, expected))
+
+
 @pytest.mark.parametrize(
     ("target", "hook"),
     [